@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Daily Ingest Report - totals a day's conversions into the JPC_AV_YYYYMMDD folder.
+
+Scans the _conversion.log files written by mov_to_mkv_ffv1.py (and the tag sidecars
+written by mkv_tag_extract.py next to them) and saves machine-readable daily totals
+alongside the Begin/End The Day notes. Parsed logs are cached by size and modification
+time, so each run only reads logs that are new or have changed.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+# ==============================
+# TERMINAL COLORS
+# ==============================
+
+class Colors:
+    """ANSI color codes for terminal output."""
+    BOLD = '\033[1m'
+    DIM = '\033[2m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    MAGENTA = '\033[95m'
+    WHITE = '\033[97m'
+    RESET = '\033[0m'
+
+    @classmethod
+    def disable(cls):
+        """Disable colors (for non-TTY output)."""
+        for attr in ['BOLD', 'DIM', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'MAGENTA', 'WHITE', 'RESET']:
+            setattr(cls, attr, '')
+
+# Disable colors if not a TTY
+if not sys.stdout.isatty():
+    Colors.disable()
+
+
+def print_status(status: str, message: str, indent: int = 0):
+    """Print a colorized status message."""
+    C = Colors
+    indent_str = "  " * indent
+
+    symbols = {
+        "success": f"{C.GREEN}✓{C.RESET}",
+        "error": f"{C.RED}✗{C.RESET}",
+        "warning": f"{C.YELLOW}!{C.RESET}",
+        "info": f"{C.CYAN}→{C.RESET}",
+        "skip": f"{C.DIM}○{C.RESET}",
+    }
+    symbol = symbols.get(status, " ")
+    print(f"{indent_str}{symbol} {message}")
+
+
+# ==============================
+# LOG PARSING
+# ==============================
+
+LOG_SUFFIX = "_conversion.log"
+SIDECAR_SUFFIX = "_output_tags.json"
+FFV1_SECTION = "FFV1/MKV Preservation Copy"
+ACCESS_SECTION = "H.264/MP4 Access Derivative"
+HASH_TAGS = ("VIDEO_STREAM_HASH", "AUDIO_STREAM_HASH")
+
+CACHE_VERSION = 2
+DEFAULT_CACHE = Path.home() / ".jpc_av_ingest_cache.json"
+
+SIZE_RE = re.compile(r"^(Source|Output) size:\s+([\d,]+) bytes")
+PROGRESS_RE = re.compile(r"frame=\s*(\d+)\s+fps=\s*([\d.]+).*?time=\s*(\d+):(\d+):([\d.]+).*?speed=\s*([\d.]+)x")
+
+
+def parse_elapsed(value: str) -> float:
+    """Convert a timedelta string ('1 day, 2:03:04.5' or '0:01:02.3') to seconds."""
+    days = 0
+    if "day" in value:
+        day_part, value = value.split(",", 1)
+        days = int(day_part.split()[0])
+    hours, minutes, seconds = value.strip().split(":")
+    return days * 86400 + int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def encode_fps(section_text: str):
+    """Return the encode speed of an ffmpeg run from its final progress line.
+
+    Derived from frames x speed / media time, because ffmpeg reports fps=0.0
+    for runs shorter than a couple of seconds.
+    """
+    matches = PROGRESS_RE.findall(section_text)
+    if not matches:
+        return None
+    frames, fps, hours, minutes, seconds, speed = matches[-1]
+    media_seconds = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    if media_seconds > 0 and float(speed) > 0:
+        return round(int(frames) * float(speed) / media_seconds, 2)
+    return float(fps) or None
+
+
+def parse_conversion_log(log_path: Path) -> dict:
+    """Parse a ConversionLog file into a record of its totals."""
+    record = {
+        "source": None,
+        "started": None,
+        "status": "INCOMPLETE",
+        "bytes_in": 0,
+        "bytes_out": 0,
+        "bytes_access": 0,
+        "encode_fps": None,
+        "elapsed_seconds": None,
+    }
+    section = None
+    ffv1_lines = []
+
+    with open(log_path, encoding='utf-8', errors='replace') as f:
+        lines = f.read().split('\n')
+
+    for i, line in enumerate(lines):
+        # Section labels sit between two rules of dashes
+        if line.startswith("-" * 70) and i + 2 < len(lines) and lines[i + 2].startswith("-" * 70):
+            section = lines[i + 1].strip()
+            continue
+
+        if section == FFV1_SECTION:
+            ffv1_lines.append(line)
+
+        size_match = SIZE_RE.match(line)
+        if size_match:
+            size = int(size_match.group(2).replace(",", ""))
+            if size_match.group(1) == "Source":
+                record["bytes_in"] += size
+            elif section == FFV1_SECTION:
+                record["bytes_out"] += size
+            elif section == ACCESS_SECTION:
+                record["bytes_access"] += size
+        elif line.startswith("Timestamp:"):
+            record["started"] = line.split(":", 1)[1].strip()
+        elif line.startswith("Source file:"):
+            record["source"] = line.split(":", 1)[1].strip()
+        elif line.startswith("Elapsed:"):
+            record["elapsed_seconds"] = parse_elapsed(line.split(":", 1)[1])
+        elif line.startswith("Status:"):
+            record["status"] = line.split(":", 1)[1].strip()
+
+    record["encode_fps"] = encode_fps('\n'.join(ffv1_lines))
+    return record
+
+
+def read_verify_status(sidecar_path: Path) -> str:
+    """Check the tag sidecar of a converted file for its stream hashes.
+
+    Returns "verified", "missing_hashes" or "no_sidecar".
+    """
+    try:
+        with open(sidecar_path, encoding='utf-8') as f:
+            tags = json.load(f).get('tags', {})
+    except (OSError, ValueError, AttributeError):
+        return "no_sidecar"
+    return "verified" if all(tags.get(name) for name in HASH_TAGS) else "missing_hashes"
+
+
+# ==============================
+# CACHE
+# ==============================
+
+class ScanCache:
+    """Parsed results keyed by file path, reused while a file's size and mtime are unchanged."""
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION and isinstance(data.get("entries"), dict):
+                self.entries = data["entries"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def get(self, path: Path, parse):
+        """Return the cached result for path, calling parse(path) if it is new or changed."""
+        try:
+            stat = path.stat()
+            signature = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            signature = None
+
+        key = str(path)
+        entry = self.entries.get(key)
+        # A malformed entry (truncated or hand-edited cache) is just a miss
+        if isinstance(entry, dict) and "result" in entry and entry.get("signature") == signature:
+            return entry["result"]
+
+        result = parse(path)
+        self.entries[key] = {"signature": signature, "result": result}
+        self.dirty = True
+        return result
+
+    def save(self):
+        """Write the cache back to disk if anything was parsed."""
+        if not self.dirty:
+            return
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+
+# ==============================
+# REPORT
+# ==============================
+
+def find_conversion_logs(directories: list) -> list:
+    """Find all conversion logs under the given directories."""
+    logs = []
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            for filename in files:
+                if filename.endswith(LOG_SUFFIX):
+                    logs.append(Path(root) / filename)
+    return sorted(logs)
+
+
+def build_report(directories: list, day: date, cache: ScanCache) -> dict:
+    """Collect the conversions started on `day` and total them."""
+    day_prefix = day.isoformat()
+    files = []
+
+    for log_path in find_conversion_logs(directories):
+        record = cache.get(log_path, parse_conversion_log)
+        if not (record.get("started") or "").startswith(day_prefix):
+            continue
+
+        base_name = log_path.name[:-len(LOG_SUFFIX)]
+        sidecar_path = log_path.parent / f"{base_name}{SIDECAR_SUFFIX}"
+        verify = cache.get(sidecar_path, read_verify_status) if record["status"] == "SUCCESS" else None
+        files.append(dict(record, log=str(log_path), verify=verify))
+
+    converted = [f for f in files if f["status"] == "SUCCESS"]
+    fps_values = [f["encode_fps"] for f in converted if f["encode_fps"]]
+    gb = 1024 ** 3
+
+    totals = {
+        "files_converted": len(converted),
+        "failures": sum(1 for f in files if f["status"] == "FAILED"),
+        "incomplete": sum(1 for f in files if f["status"] not in ("SUCCESS", "FAILED")),
+        "gb_in": round(sum(f["bytes_in"] for f in converted) / gb, 3),
+        "gb_out": round(sum(f["bytes_out"] for f in converted) / gb, 3),
+        "gb_access": round(sum(f["bytes_access"] for f in converted) / gb, 3),
+        "mean_encode_fps": round(sum(fps_values) / len(fps_values), 2) if fps_values else None,
+        # Whole-log elapsed time (both encodes and tag padding) of the converted files
+        "conversion_hours": round(sum(f["elapsed_seconds"] or 0 for f in converted) / 3600, 3),
+        "verify": {
+            status: sum(1 for f in converted if f["verify"] == status)
+            for status in ("verified", "missing_hashes", "no_sidecar")
+        },
+    }
+
+    return {
+        "date": day.strftime("%Y%m%d"),
+        "generated": datetime.now().isoformat(),
+        "directories": [str(d) for d in directories],
+        "totals": totals,
+        "files": files,
+    }
+
+
+# ==============================
+# MAIN
+# ==============================
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(
+        description="Total a day's conversion logs and tag sidecars into ~/JPC_AV_YYYYMMDD"
+    )
+    parser.add_argument("-d", "--directory", nargs='+', required=True, metavar='PATH',
+                        help="Directories searched (recursively) for _conversion.log files")
+    parser.add_argument("--date", metavar='YYYYMMDD',
+                        help="Day to report on (default: today)")
+    parser.add_argument("--home", type=str, default=str(Path.home()), metavar='PATH',
+                        help="Directory holding the JPC_AV_YYYYMMDD folders (default: home directory)")
+    parser.add_argument("--cache", type=str, default=str(DEFAULT_CACHE), metavar='FILE',
+                        help=f"Cache of parsed logs (default: {DEFAULT_CACHE})")
+    parser.add_argument("--no-color", action='store_true', help="Disable colored output")
+
+    args = parser.parse_args()
+
+    if args.no_color:
+        Colors.disable()
+
+    C = Colors
+
+    try:
+        day = datetime.strptime(args.date, "%Y%m%d").date() if args.date else date.today()
+    except ValueError:
+        parser.error(f"--date must be YYYYMMDD: {args.date}")
+
+    directories = [Path(d).resolve() for d in args.directory]
+    for directory in directories:
+        if not directory.is_dir():
+            print_status("error", f"Directory not found: {directory}")
+            sys.exit(1)
+
+    # Same folder the begin/end scripts use
+    folder = Path(args.home) / f"JPC_AV_{day.strftime('%Y%m%d')}"
+    if folder.is_dir():
+        print_status("info", f"Folder '{folder.name}' already exists. Not a problem!")
+    else:
+        folder.mkdir(parents=True)
+        print_status("success", f"Folder '{folder.name}' created successfully.")
+
+    cache = ScanCache(Path(args.cache))
+    report = build_report(directories, day, cache)
+    try:
+        cache.save()
+    except OSError as e:
+        print_status("warning", f"Cache not saved: {e}")
+
+    report_file = folder / f"{folder.name}_ingest.json"
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+
+    totals = report["totals"]
+    fps = totals["mean_encode_fps"]
+    print(f"\n{C.BOLD}INGEST {report['date']}{C.RESET}")
+    print(f"  {C.GREEN}Converted:{C.RESET}  {totals['files_converted']}")
+    print(f"  {C.CYAN}GB in/out:{C.RESET}  {totals['gb_in']:.2f} / {totals['gb_out']:.2f}")
+    print(f"  {C.CYAN}Mean fps:{C.RESET}   {fps if fps is not None else '-'}")
+    print(f"  {C.CYAN}Verified:{C.RESET}   {totals['verify']['verified']}/{totals['files_converted']}")
+    if totals["failures"] > 0:
+        print(f"  {C.RED}Failures:{C.RESET}   {totals['failures']}")
+    print()
+    print_status("success", f"Saved: {report_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,15 @@ from colorama import init, Fore, Style
 # Initialize colorama
 init(autoreset=True)
 
+# The desired order of tags (also the catalog of tags mkv_tag_write.py expects)
+ORDER_OF_TAGS = [
+    "ENCODER", "VIDEO_STREAM_HASH", "AUDIO_STREAM_HASH", 
+    "COLLECTION", "TITLE", "CATALOG_NUMBER", 
+    "DESCRIPTION", "DATE_DIGITIZED", "ENCODER_SETTINGS", 
+    "ENCODED_BY", "ORIGINAL_MEDIA_TYPE", "DATE_TAGGED", 
+    "TERMS_OF_USE", "_TECHNICAL_NOTES", "_ORIGINAL_FPS"
+]
+
 def extract_mkv_metadata(file_path):
     """
     Extracts the 'tags' section from an MKV file using ffprobe and returns it as a dictionary.
@@ -66,17 +75,8 @@ def save_metadata_to_txt(data, output_file):
     with open(output_file, 'w') as txt_file:
         txt_file.write(f"file: {data['file']}\n\n")
 
-        # The desired order of tags
-        order_of_tags = [
-            "ENCODER", "VIDEO_STREAM_HASH", "AUDIO_STREAM_HASH", 
-            "COLLECTION", "TITLE", "CATALOG_NUMBER", 
-            "DESCRIPTION", "DATE_DIGITIZED", "ENCODER_SETTINGS", 
-            "ENCODED_BY", "ORIGINAL_MEDIA_TYPE", "DATE_TAGGED", 
-            "TERMS_OF_USE", "_TECHNICAL_NOTES", "_ORIGINAL_FPS"
-        ]
-
         # Iterate over the specified order and write each tag with spacing
-        for idx, key in enumerate(order_of_tags):
+        for idx, key in enumerate(ORDER_OF_TAGS):
             if key in data['tags']:
                 # Only write AUDIO_STREAM_HASH once
                 if key == "VIDEO_STREAM_HASH":
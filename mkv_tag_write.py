@@ -0,0 +1,778 @@
+#!/usr/bin/env python3
+"""
+MKV Tag Writer - updates Matroska tags in place, the counterpart to mkv_tag_extract.py.
+
+Applies tag edits from a CSV or JSON edit list to existing .mkv files without remuxing.
+Only the Tags element is rewritten (plus the SeekHead and Segment size when the tags
+have to move to the end of the file), so each file costs a few KB of I/O regardless
+of its size. Every file is re-read with ffprobe (through mkv_tag_extract.py) afterwards
+to verify the edits.
+"""
+
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# ==============================
+# TERMINAL COLORS
+# ==============================
+
+class Colors:
+    """ANSI color codes for terminal output."""
+    BOLD = '\033[1m'
+    DIM = '\033[2m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    MAGENTA = '\033[95m'
+    WHITE = '\033[97m'
+    RESET = '\033[0m'
+
+    @classmethod
+    def disable(cls):
+        """Disable colors (for non-TTY output)."""
+        for attr in ['BOLD', 'DIM', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'MAGENTA', 'WHITE', 'RESET']:
+            setattr(cls, attr, '')
+
+# Disable colors if not a TTY
+if not sys.stdout.isatty():
+    Colors.disable()
+
+
+def print_status(status: str, message: str, indent: int = 0):
+    """Print a colorized status message."""
+    C = Colors
+    indent_str = "  " * indent
+
+    symbols = {
+        "success": f"{C.GREEN}✓{C.RESET}",
+        "error": f"{C.RED}✗{C.RESET}",
+        "warning": f"{C.YELLOW}!{C.RESET}",
+        "info": f"{C.CYAN}→{C.RESET}",
+        "skip": f"{C.DIM}○{C.RESET}",
+    }
+    symbol = symbols.get(status, " ")
+    print(f"{indent_str}{symbol} {message}")
+
+
+# ==============================
+# EBML / MATROSKA
+# ==============================
+
+EBML_HEADER_ID = 0x1A45DFA3
+SEGMENT_ID = 0x18538067
+INFO_ID = 0x1549A966
+TITLE_ID = 0x7BA9
+SEEKHEAD_ID = 0x114D9B74
+SEEK_ID = 0x4DBB
+SEEK_ID_ID = 0x53AB
+SEEK_POSITION_ID = 0x53AC
+CLUSTER_ID = 0x1F43B675
+TAGS_ID = 0x1254C367
+TAG_ID = 0x7373
+TARGETS_ID = 0x63C0
+SIMPLE_TAG_ID = 0x67C8
+TAG_NAME_ID = 0x45A3
+TAG_STRING_ID = 0x4487
+TAG_BINARY_ID = 0x4485
+VOID_ID = 0xEC
+CRC32_ID = 0xBF
+
+# TagTrackUID, TagEditionUID, TagChapterUID, TagAttachmentUID
+TARGET_UID_IDS = {0x63C5, 0x63C9, 0x63C4, 0x63C6}
+
+# Void padding left after the Tags element whenever it has to be (re)written at the
+# end of the file, so the next edits fit in place
+DEFAULT_TAG_PADDING = 4096
+
+
+class TagWriteError(Exception):
+    """Raised when a file's tags cannot be read or updated safely."""
+
+
+class Element:
+    """Position of an EBML element within a file."""
+
+    def __init__(self, element_id: int, offset: int, header_size: int, data_size: int = None):
+        self.id = element_id
+        self.offset = offset
+        self.header_size = header_size
+        self.data_size = data_size  # None for elements of unknown size
+
+    @property
+    def data_offset(self) -> int:
+        return self.offset + self.header_size
+
+    @property
+    def end(self) -> int:
+        return self.data_offset + self.data_size
+
+
+def parse_element_header(data: bytes, pos: int = 0):
+    """Parse the element header at data[pos:]; return (element_id, data_size, header_size)."""
+    def vint_length(at):
+        if at >= len(data) or data[at] == 0:
+            raise TagWriteError("truncated or invalid EBML element header")
+        return 8 - data[at].bit_length() + 1
+
+    id_length = vint_length(pos)
+    size_pos = pos + id_length
+    size_length = vint_length(size_pos)
+    if id_length > 4 or size_pos + size_length > len(data):
+        raise TagWriteError("truncated or invalid EBML element header")
+
+    element_id = int.from_bytes(data[pos:size_pos], 'big')
+    max_value = (1 << (7 * size_length)) - 1
+    data_size = int.from_bytes(data[size_pos:size_pos + size_length], 'big') & max_value
+    if data_size == max_value:
+        data_size = None
+    return element_id, data_size, id_length + size_length
+
+
+def read_element(f, offset: int) -> Element:
+    """Read the element header at a file offset."""
+    f.seek(offset)
+    element_id, data_size, header_size = parse_element_header(f.read(12))
+    return Element(element_id, offset, header_size, data_size)
+
+
+def read_payload(f, element: Element) -> bytes:
+    """Read an element's data."""
+    f.seek(element.data_offset)
+    data = f.read(element.data_size)
+    if len(data) != element.data_size:
+        raise TagWriteError(f"element at offset {element.offset} runs past end of file")
+    return data
+
+
+def split_children(data: bytes) -> list:
+    """Split a master element's data into (element_id, payload, raw_bytes) tuples."""
+    children = []
+    pos = 0
+    while pos < len(data):
+        element_id, data_size, header_size = parse_element_header(data, pos)
+        end = pos + header_size + (data_size if data_size is not None else len(data))
+        if data_size is None or end > len(data):
+            raise TagWriteError("malformed child element")
+        children.append((element_id, data[pos + header_size:end], data[pos:end]))
+        pos = end
+    return children
+
+
+def encode_size(size: int, length: int = None) -> bytes:
+    """Encode an element data size, optionally with a fixed field length."""
+    min_length = 1
+    while size >= (1 << (7 * min_length)) - 1:
+        min_length += 1
+    length = length or min_length
+    if length < min_length or length > 8:
+        raise TagWriteError(f"size {size} does not fit in a {length}-byte field")
+    return ((1 << (7 * length)) | size).to_bytes(length, 'big')
+
+
+def encode_element(element_id: int, payload: bytes, size_length: int = None) -> bytes:
+    """Encode a complete element."""
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, 'big')
+    return id_bytes + encode_size(len(payload), size_length) + payload
+
+
+def encode_master(element_id: int, children: list, with_crc: bool = False,
+                  size_length: int = None) -> bytes:
+    """Encode a master element, leading with a fresh CRC-32 element if requested."""
+    payload = b''.join(children)
+    if with_crc:
+        payload = encode_element(CRC32_ID, struct.pack('<I', zlib.crc32(payload))) + payload
+    return encode_element(element_id, payload, size_length)
+
+
+def encode_uint(value: int) -> bytes:
+    return value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+
+
+def encode_void(total_size: int, header_only: bool = False) -> bytes:
+    """Encode a Void element occupying exactly total_size bytes.
+
+    With header_only the payload is left out, for blanking space whose old contents
+    can stay on disk.
+    """
+    for size_length in range(1, 9):
+        data_size = total_size - 1 - size_length
+        if 0 <= data_size < (1 << (7 * size_length)) - 1:
+            header = bytes([VOID_ID]) + encode_size(data_size, size_length)
+            return header if header_only else header + bytes(data_size)
+    raise TagWriteError(f"cannot fill {total_size} byte(s) with a Void element")
+
+
+def widen_size_field(element: bytes) -> bytes:
+    """Re-encode an element with a size field one byte longer (absorbs a 1-byte gap)."""
+    element_id, data_size, header_size = parse_element_header(element)
+    id_length = (element_id.bit_length() + 7) // 8
+    return (element[:id_length]
+            + encode_size(data_size, header_size - id_length + 1)
+            + element[header_size:])
+
+
+class MatroskaLayout:
+    """Positions of the level 1 elements the tag writer needs."""
+
+    def __init__(self, segment: Element, seekhead: Element = None, tags: Element = None,
+                 info: Element = None):
+        self.segment = segment
+        self.seekhead = seekhead
+        self.tags = tags
+        self.info = info
+
+    def segment_end(self, file_size: int) -> int:
+        if self.segment.data_size is None:
+            return file_size
+        return self.segment.end
+
+
+def read_layout(f, file_size: int) -> MatroskaLayout:
+    """Locate the Segment, SeekHead, Info and Tags elements of a Matroska file.
+
+    Only the element headers ahead of the first Cluster are walked; Tags stored
+    after the media data are found through the SeekHead.
+    """
+    header = read_element(f, 0)
+    if header.id != EBML_HEADER_ID or header.data_size is None:
+        raise TagWriteError("not a Matroska file")
+    segment = read_element(f, header.end)
+    if segment.id != SEGMENT_ID:
+        raise TagWriteError("no Matroska Segment after the EBML header")
+
+    layout = MatroskaLayout(segment)
+    segment_end = layout.segment_end(file_size)
+
+    pos = segment.data_offset
+    while pos < segment_end:
+        element = read_element(f, pos)
+        if element.id == CLUSTER_ID:
+            break
+        if element.data_size is None:
+            raise TagWriteError(f"unknown-size element at offset {pos}")
+        if element.id == SEEKHEAD_ID and layout.seekhead is None:
+            layout.seekhead = element
+        elif element.id == TAGS_ID and layout.tags is None:
+            layout.tags = element
+        elif element.id == INFO_ID and layout.info is None:
+            layout.info = element
+        pos = element.end
+
+    if layout.tags is None and layout.seekhead is not None:
+        position = read_seek_positions(read_payload(f, layout.seekhead)).get(TAGS_ID)
+        if position is not None:
+            element = read_element(f, segment.data_offset + position)
+            if element.id != TAGS_ID or element.data_size is None:
+                raise TagWriteError("SeekHead entry for Tags does not point at a Tags element")
+            layout.tags = element
+
+    if layout.tags is not None and layout.tags.end > segment_end:
+        raise TagWriteError("Tags element runs past the end of the Segment")
+    return layout
+
+
+def read_seek_positions(seekhead_payload: bytes) -> dict:
+    """Map element IDs to their SeekPosition (relative to the Segment data)."""
+    positions = {}
+    for child_id, payload, _ in split_children(seekhead_payload):
+        if child_id != SEEK_ID:
+            continue
+        entry = {entry_id: value for entry_id, value, _ in split_children(payload)}
+        if SEEK_ID_ID in entry and SEEK_POSITION_ID in entry:
+            element_id = int.from_bytes(entry[SEEK_ID_ID], 'big')
+            positions.setdefault(element_id, int.from_bytes(entry[SEEK_POSITION_ID], 'big'))
+    return positions
+
+
+def build_seekhead(seekhead_payload: bytes, element_id: int, position: int) -> bytes:
+    """Return a SeekHead with the entry for element_id pointing at position."""
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, 'big')
+    new_entry = encode_element(SEEK_ID, (encode_element(SEEK_ID_ID, id_bytes)
+                                         + encode_element(SEEK_POSITION_ID, encode_uint(position))))
+    children = []
+    with_crc = False
+    replaced = False
+    for child_id, payload, raw in split_children(seekhead_payload):
+        if child_id == CRC32_ID:
+            with_crc = True
+            continue
+        if child_id == VOID_ID:
+            continue
+        if child_id == SEEK_ID and not replaced:
+            entry = {entry_id: value for entry_id, value, _ in split_children(payload)}
+            if entry.get(SEEK_ID_ID) == id_bytes:
+                children.append(new_entry)
+                replaced = True
+                continue
+        children.append(raw)
+    if not replaced:
+        children.append(new_entry)
+    return encode_master(SEEKHEAD_ID, children, with_crc)
+
+
+def blank_info_title(info: Element, info_payload: bytes):
+    """Return the Info element with its Title turned into a Void, or None if it has no Title.
+
+    ffprobe reads Segment Info Title as the file's title, so it would hide a TITLE tag
+    being removed and go stale when one is changed. The Void keeps Info the same size.
+    """
+    children = []
+    with_crc = False
+    found = False
+    for child_id, _, raw in split_children(info_payload):
+        if child_id == CRC32_ID:
+            with_crc = True
+            continue
+        if child_id == TITLE_ID:
+            raw = encode_void(len(raw))
+            found = True
+        children.append(raw)
+    if not found:
+        return None
+
+    new_info = encode_master(INFO_ID, children, with_crc, size_length=info.header_size - 4)
+    if len(new_info) != info.end - info.offset:
+        raise TagWriteError("cannot clear the Segment Info title in place")
+    return new_info
+
+
+def free_space_end(f, offset: int, limit: int) -> int:
+    """Return the end of the run of Void elements starting at offset."""
+    while offset < limit:
+        element = read_element(f, offset)
+        if element.id != VOID_ID or element.data_size is None:
+            break
+        offset = element.end
+    return offset
+
+
+# ==============================
+# TAGS
+# ==============================
+
+def is_global_tag(tag_payload: bytes) -> bool:
+    """True for a Tag that applies to the whole file (what ffprobe reports as format tags)."""
+    for child_id, payload, _ in split_children(tag_payload):
+        if child_id == TARGETS_ID:
+            for target_id, value, _ in split_children(payload):
+                if target_id in TARGET_UID_IDS and int.from_bytes(value, 'big') != 0:
+                    return False
+    return True
+
+
+def read_simple_tag(simple_tag_payload: bytes):
+    """Return (name, value) of a SimpleTag; value is None for binary tags."""
+    fields = {child_id: payload for child_id, payload, _ in split_children(simple_tag_payload)}
+    name = fields.get(TAG_NAME_ID, b'').decode('utf-8', errors='replace')
+    value = fields.get(TAG_STRING_ID)
+    return name, value.decode('utf-8', errors='replace') if value is not None else None
+
+
+def read_global_tags(tags_payload: bytes) -> dict:
+    """Return the file-level tags as {NAME: value}, names upper-cased."""
+    tags = {}
+    for child_id, payload, _ in split_children(tags_payload):
+        if child_id != TAG_ID or not is_global_tag(payload):
+            continue
+        for tag_child_id, simple_tag, _ in split_children(payload):
+            if tag_child_id == SIMPLE_TAG_ID:
+                name, value = read_simple_tag(simple_tag)
+                tags.setdefault(name.upper(), value)
+    return tags
+
+
+def edits_applied(current: dict, edits: dict) -> bool:
+    """True if the file-level tags already reflect every edit (None means removed)."""
+    return all(current.get(name.upper()) == value for name, value in edits.items())
+
+
+def encode_simple_tag(name: str, value: str) -> bytes:
+    # Matroska TagNames are upper case
+    return encode_element(SIMPLE_TAG_ID, (encode_element(TAG_NAME_ID, name.upper().encode('utf-8'))
+                                          + encode_element(TAG_STRING_ID, value.encode('utf-8'))))
+
+
+def edit_tag(tag_payload: bytes, edits: dict):
+    """Apply edits to a global Tag; return the encoded Tag, or None if no SimpleTag is left."""
+    wanted = {name.upper(): (name, value) for name, value in edits.items()}
+    remaining = dict(wanted)
+    children = []
+    with_crc = False
+    has_simple_tags = False
+
+    for child_id, payload, raw in split_children(tag_payload):
+        if child_id == CRC32_ID:
+            with_crc = True
+            continue
+        if child_id == SIMPLE_TAG_ID:
+            name, _ = read_simple_tag(payload)
+            key = name.upper()
+            if key in wanted:
+                # Later duplicates of an edited name are dropped
+                if key not in remaining:
+                    continue
+                _, value = remaining.pop(key)
+                if value is None:
+                    continue
+                # Keep TagName, TagLanguage, TagDefault and nested tags; swap the value
+                fields = [child for child in split_children(payload)
+                          if child[0] not in (TAG_STRING_ID, TAG_BINARY_ID)]
+                raws = [child_raw for _, _, child_raw in fields]
+                name_index = next((i for i, child in enumerate(fields) if child[0] == TAG_NAME_ID), -1)
+                raws.insert(name_index + 1, encode_element(TAG_STRING_ID, value.encode('utf-8')))
+                raw = encode_element(SIMPLE_TAG_ID, b''.join(raws))
+            has_simple_tags = True
+        children.append(raw)
+
+    for name, value in remaining.values():
+        if value is not None:
+            children.append(encode_simple_tag(name, value))
+            has_simple_tags = True
+
+    if not has_simple_tags:
+        return None
+    return encode_master(TAG_ID, children, with_crc)
+
+
+def build_tags(tags_payload: bytes, edits: dict) -> bytes:
+    """Return a new Tags element with edits applied to the file-level Tag.
+
+    Track, chapter and attachment tags are copied byte for byte.
+    """
+    children = []
+    with_crc = False
+    edited = False
+
+    for child_id, payload, raw in split_children(tags_payload or b''):
+        if child_id == CRC32_ID:
+            with_crc = True
+            continue
+        if child_id == VOID_ID:
+            continue
+        if child_id == TAG_ID and not edited and is_global_tag(payload):
+            edited = True
+            raw = edit_tag(payload, edits)
+            if raw is None:
+                continue
+        children.append(raw)
+
+    if not edited:
+        tag = edit_tag(encode_element(TARGETS_ID, b''), edits)
+        if tag is not None:
+            children.insert(0, tag)
+
+    if not children:
+        raise TagWriteError("edits would leave the file without any tags")
+    return encode_master(TAGS_ID, children, with_crc)
+
+
+def write_tags(mkv_file: Path, edits: dict, padding: int = DEFAULT_TAG_PADDING,
+               min_free: int = 0, dry_run: bool = False) -> str:
+    """Apply tag edits to an MKV file without remuxing it.
+
+    The new Tags element overwrites the old one when it fits in the old element plus
+    any Void padding after it. Otherwise it is appended to the end of the file followed
+    by `padding` bytes of Void, the SeekHead entry and Segment size are updated, and the
+    old element is turned into a Void. `min_free` is the least padding to leave after
+    the Tags when writing in place. Editing TITLE also clears the Segment Info title,
+    so the TITLE tag is what players and ffprobe report.
+
+    Returns "unchanged", "in place" or "relocated".
+    """
+    if padding == 1:
+        raise TagWriteError("padding must be 0 or at least 2 bytes")
+
+    with open(mkv_file, 'rb' if dry_run else 'r+b') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        layout = read_layout(f, file_size)
+        segment_end = layout.segment_end(file_size)
+        tags = layout.tags
+
+        tags_payload = read_payload(f, tags) if tags else None
+        if tags:
+            region_end = free_space_end(f, tags.end, segment_end)
+            current = read_global_tags(tags_payload)
+        else:
+            region_end = None
+            current = {}
+
+        new_info = None
+        if layout.info is not None and any(name.upper() == "TITLE" for name in edits):
+            new_info = blank_info_title(layout.info, read_payload(f, layout.info))
+
+        if (edits_applied(current, edits) and new_info is None
+                and (tags is None or region_end - tags.end >= min_free)):
+            return "unchanged"
+
+        new_tags = build_tags(tags_payload, edits)
+        patches = []
+
+        if tags:
+            spare = region_end - tags.offset - len(new_tags)
+            if spare == 1 and min_free <= 1:
+                # A Void needs at least two bytes; absorb the gap in the size field
+                new_tags = widen_size_field(new_tags)
+                spare = 0
+            if spare >= min_free and spare != 1:
+                patches.append((tags.offset, new_tags + (encode_void(spare, header_only=True) if spare else b'')))
+
+        if not patches:
+            if segment_end != file_size:
+                raise TagWriteError("Segment does not end at the end of the file; cannot append tags")
+            if layout.seekhead is None:
+                raise TagWriteError("no SeekHead to point at relocated tags")
+
+            appended = new_tags + (encode_void(padding) if padding else b'')
+            patches.append((file_size, appended))
+
+            if layout.segment.data_size is not None:
+                segment = layout.segment
+                size_field = encode_size(segment.data_size + len(appended),
+                                         segment.header_size - 4)
+                patches.append((segment.offset + 4, size_field))
+
+            seekhead = layout.seekhead
+            new_seekhead = build_seekhead(read_payload(f, seekhead), TAGS_ID,
+                                          file_size - layout.segment.data_offset)
+            seekhead_spare = (free_space_end(f, seekhead.end, segment_end)
+                              - seekhead.offset - len(new_seekhead))
+            if seekhead_spare == 1:
+                new_seekhead = widen_size_field(new_seekhead)
+                seekhead_spare = 0
+            if seekhead_spare < 0:
+                raise TagWriteError("no room in the SeekHead to point at relocated tags")
+            patches.append((seekhead.offset, new_seekhead
+                            + (encode_void(seekhead_spare, header_only=True) if seekhead_spare else b'')))
+
+            if tags:
+                patches.append((tags.offset, encode_void(tags.end - tags.offset, header_only=True)))
+            mode = "relocated"
+        else:
+            mode = "in place"
+
+        if new_info is not None:
+            patches.append((layout.info.offset, new_info))
+
+        if dry_run:
+            return mode
+
+        # Patches are ordered so an interrupted run never leaves the SeekHead
+        # pointing at tags that have not been written yet
+        for offset, data in patches:
+            f.seek(offset)
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    return mode
+
+
+def reserve_tag_padding(mkv_file: Path, padding: int = DEFAULT_TAG_PADDING) -> str:
+    """Make sure at least `padding` bytes of Void follow the Tags element."""
+    return write_tags(mkv_file, {}, padding=padding, min_free=padding)
+
+
+def apply_edits(mkv_file: Path, edits: dict, padding: int = DEFAULT_TAG_PADDING,
+                dry_run: bool = False) -> str:
+    """Write edits to one file and verify them with ffprobe, as mkv_tag_extract.py sees them."""
+    from mkv_tag_extract import extract_mkv_metadata
+
+    mode = write_tags(mkv_file, edits, padding=padding, dry_run=dry_run)
+    if not dry_run:
+        metadata = extract_mkv_metadata(str(mkv_file))
+        if metadata is None:
+            raise TagWriteError("ffprobe could not re-read the file")
+        current = {name.upper(): value for name, value in metadata['tags'].items()}
+        mismatched = [name for name, value in edits.items() if current.get(name.upper()) != value]
+        if mismatched:
+            raise TagWriteError(f"verification failed for: {', '.join(mismatched)}")
+    return mode
+
+
+# ==============================
+# EDIT LISTS
+# ==============================
+
+def load_edit_list(edit_list: Path) -> list:
+    """Load (file, {TAG: value}) pairs from a CSV or JSON edit list.
+
+    CSV: a `file` column plus one column per tag; empty cells are left unchanged.
+    JSON: the output of mkv_tag_extract.py ({"file": ..., "tags": {...}}), a list of
+    those, or a {file: {TAG: value}} mapping; a null value removes the tag.
+    Tag names are upper-cased.
+    """
+    if edit_list.suffix.lower() == '.csv':
+        with open(edit_list, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            if 'file' not in (reader.fieldnames or []):
+                raise ValueError(f"{edit_list.name} has no 'file' column")
+            entries = []
+            for row in reader:
+                name = row.pop('file')
+                tags = {key.strip().upper(): value for key, value in row.items()
+                        if key and value not in (None, '')}
+                entries.append((name, tags))
+
+    elif edit_list.suffix.lower() == '.json':
+        with open(edit_list, encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and 'file' in data:
+            data = [data]
+        if isinstance(data, dict):
+            entries = list(data.items())
+        elif isinstance(data, list) and all(isinstance(item, dict) and 'file' in item for item in data):
+            entries = [(item['file'], item.get('tags', {})) for item in data]
+        else:
+            raise ValueError(f"{edit_list.name} is not a recognized edit list")
+        for name, tags in entries:
+            if not isinstance(tags, dict):
+                raise ValueError(f"tags for {name} are not a JSON object")
+        entries = [(name, {key.strip().upper(): (str(value) if value is not None else None)
+                           for key, value in tags.items()})
+                   for name, tags in entries]
+
+    else:
+        raise ValueError(f"edit list must be .csv or .json: {edit_list.name}")
+
+    return [(name, tags) for name, tags in entries if name and tags]
+
+
+def index_mkv_files(directories: list) -> dict:
+    """Map .mkv basenames to their paths under the given directories."""
+    index = {}
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            for filename in files:
+                if filename.endswith('.mkv'):
+                    index.setdefault(filename, []).append(Path(root) / filename)
+    return index
+
+
+def resolve_target(name: str, index: dict, base_dir: Path) -> Path:
+    """Resolve an edit list entry to a file: a path (relative to the edit list) or a basename."""
+    candidate = Path(name)
+    if not candidate.is_absolute():
+        candidate = base_dir / candidate
+    if candidate.is_file():
+        return candidate.resolve()
+
+    matches = index.get(Path(name).name, [])
+    if len(matches) == 1:
+        return matches[0].resolve()
+    if matches:
+        raise TagWriteError(f"{name} matches {len(matches)} files")
+    raise TagWriteError(f"{name} not found")
+
+
+# ==============================
+# MAIN
+# ==============================
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(
+        description="Apply tag edits from a CSV/JSON edit list to MKV files in place, without remuxing"
+    )
+    parser.add_argument("edit_list", help="CSV or JSON edit list (see load_edit_list)")
+    parser.add_argument("-d", "--directory", nargs='+', default=[], metavar='PATH',
+                        help="Directories searched (recursively) for files named in the edit list")
+    parser.add_argument("-j", "--jobs", type=int, default=min(8, os.cpu_count() or 1),
+                        help="Number of files to update in parallel")
+    parser.add_argument("--padding", type=int, default=DEFAULT_TAG_PADDING, metavar='BYTES',
+                        help=f"Void padding left after tags that have to be moved (default {DEFAULT_TAG_PADDING})")
+    parser.add_argument("-n", "--dry-run", action='store_true',
+                        help="Report how each file would be updated without writing")
+    parser.add_argument("--no-color", action='store_true', help="Disable colored output")
+
+    args = parser.parse_args()
+
+    if args.no_color:
+        Colors.disable()
+
+    C = Colors
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.padding < 0 or args.padding == 1:
+        parser.error("--padding must be 0 or at least 2")
+
+    edit_list = Path(args.edit_list).resolve()
+    try:
+        entries = load_edit_list(edit_list)
+    except (OSError, ValueError) as e:
+        print_status("error", f"Cannot read edit list: {e}")
+        sys.exit(1)
+
+    # Imported here so mov_to_mkv_ffv1.py can use this module without colorama
+    from mkv_tag_extract import ORDER_OF_TAGS
+
+    # Tags outside the catalog are written anyway, but are usually typos
+    unknown = sorted({name.upper() for _, tags in entries for name in tags} - set(ORDER_OF_TAGS))
+    for name in unknown:
+        print_status("warning", f"{name} is not in the tag catalog")
+
+    # Merge entries per file so no file is written by two workers at once
+    index = index_mkv_files(args.directory)
+    targets = {}
+    error_count = 0
+    for name, tags in entries:
+        try:
+            path = resolve_target(name, index, edit_list.parent)
+        except TagWriteError as e:
+            print_status("error", str(e))
+            error_count += 1
+            continue
+        targets.setdefault(path, {}).update(tags)
+
+    print(f"\n{C.BOLD}Updating tags in {len(targets)} file(s){C.RESET}")
+    if args.dry_run:
+        print(f"  {C.YELLOW}{C.BOLD}DRY RUN{C.RESET}")
+    print(f"{C.DIM}{'─' * 60}{C.RESET}")
+
+    counts = {"in place": 0, "relocated": 0, "unchanged": 0}
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(apply_edits, path, tags, args.padding, args.dry_run): path
+            for path, tags in sorted(targets.items())
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                mode = future.result()
+            except (TagWriteError, OSError) as e:
+                print_status("error", f"{path.name}: {e}")
+                error_count += 1
+                continue
+            counts[mode] += 1
+            if mode == "unchanged":
+                # Dry runs skip the ffprobe re-read, so nothing was verified
+                verified = "" if args.dry_run else ", verified"
+                print_status("skip", f"{path.name}: already up to date{verified}")
+            elif args.dry_run:
+                print_status("info", f"{path.name}: would be written {mode}")
+            else:
+                print_status("success", f"{path.name}: written {mode}, verified")
+
+    # Summary
+    print(f"\n{C.DIM}{'─' * 60}{C.RESET}")
+    print(f"\n{C.BOLD}SUMMARY{C.RESET}")
+    if args.dry_run:
+        print(f"  {C.YELLOW}DRY RUN - No files were written{C.RESET}")
+    print(f"  {C.GREEN}In place:{C.RESET}   {counts['in place']}")
+    print(f"  {C.GREEN}Relocated:{C.RESET}  {counts['relocated']}")
+    print(f"  {C.DIM}Unchanged:{C.RESET}  {counts['unchanged']}")
+    if error_count > 0:
+        print(f"  {C.RED}Errors:{C.RESET}     {error_count}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@ import time
 from pathlib import Path
 from datetime import datetime
 
+from mkv_tag_write import DEFAULT_TAG_PADDING, TagWriteError, reserve_tag_padding
+
 # ==============================
 # TERMINAL COLORS
 # ==============================
@@ -85,6 +87,15 @@ class ConversionLog:
         self.lines.append(f"  {' '.join(cmd)}")
         self.lines.append("")
     
+    def log_step(self, label: str, message: str):
+        """Log a processing step that does not run an external command."""
+        self.lines.append("-" * 70)
+        self.lines.append(f"{label}")
+        self.lines.append("-" * 70)
+        self.lines.append("")
+        self.lines.append(message)
+        self.lines.append("")
+    
     def log_output(self, stdout: str, stderr: str):
         """Log ffmpeg stdout/stderr."""
         if stdout and stdout.strip():
@@ -176,6 +187,7 @@ def get_colored_help():
 {C.BOLD}{C.WHITE}TECHNICAL NOTES{C.RESET}
     {C.DIM}•{C.RESET} Uses {C.CYAN}-apply_cropping 0{C.RESET} to preserve full frame (720x486)
     {C.DIM}•{C.RESET} FFV1 settings: level 3, slicecrc 1, 24 slices (archival best practice)
+    {C.DIM}•{C.RESET} Reserves {C.CYAN}{DEFAULT_TAG_PADDING} bytes{C.RESET} of tag padding so mkv_tag_write.py edits stay in place
     {C.DIM}•{C.RESET} Access derivative: CRF 28, fast preset (optimized for remote viewing)
     {C.DIM}•{C.RESET} Original .mov files are preserved (not moved or deleted)
 """
@@ -300,8 +312,22 @@ def convert_files(mov_files: list, dry_run: bool = False, no_access: bool = Fals
             log.log_output(result.stdout, result.stderr)
             
             if result.returncode == 0:
+                # Leave Void padding after the Tags so later tag edits
+                # (mkv_tag_write.py) never require a remux. Done before logging
+                # the result so the logged output size is the final one.
+                padding_error = None
+                try:
+                    mode = reserve_tag_padding(output_file, DEFAULT_TAG_PADDING)
+                    padding_note = f"Reserved {DEFAULT_TAG_PADDING} bytes after Tags ({mode})"
+                except (TagWriteError, OSError) as e:
+                    padding_error = e
+                    padding_note = f"Not reserved: {e}"
+                
                 log.log_result(True, output_file)
+                log.log_step("Tag Padding", padding_note)
                 print_status("success", "FFV1/MKV complete", indent=3)
+                if padding_error:
+                    print_status("warning", f"Tag padding not reserved: {padding_error}", indent=3)
             else:
                 log.log_result(False, error_msg=f"ffmpeg returned {result.returncode}")
                 print_status("error", f"FFV1 error: ffmpeg returned {result.returncode}", indent=3)